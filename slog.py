@@ -6,19 +6,63 @@ Place in ~/.local/bin/slog.py and make executable
 Usage: slog.py [job_id] [options]
 """
 
-import argparse
-import configparser
+import heapq
+import io
 import os
 import re
-import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Optional, Tuple, List
+from types import SimpleNamespace
+from typing import Optional, Tuple, List, BinaryIO
+
+# Unanchored alternatives combined into the line classifiers below
+_PAT_ERROR = r'[Ee]rror|ERROR|[Ff]ailed|FAILED'
+_PAT_WARN = r'[Ww]arning|WARNING'
+_PAT_SUCCESS = r'[Ss]uccess|SUCCESS|[Cc]ompleted|COMPLETED|[Dd]one|DONE'
+_PAT_TS = r'(?:\d{4}-\d{2}-\d{2}|\d{2}:\d{2}:\d{2})'
+_PAT_BRACKET = r'\[.*\]'
+
+# Job ID from a log file name
+_RE_JOBID = re.compile(r'-(\d+)\.(out|err)$')
+
+# Line breaks in followed logs; a bare \r (progress bars) also ends a line
+_RE_LINE_BREAK = re.compile(rb'\r\n|\r|\n')
+
+# The config only carries two path keys in [paths], so a full configparser is overkill
+_CFG_SECTION_RE = re.compile(r'^\[([^\]]+)\][ \t]*$', re.M)
+_CFG_RE = re.compile(r'^[ \t]*(logs_out_dir|logs_err_dir)[ \t]*[=:][ \t]*(.+?)[ \t]*$', re.M | re.I)
+
+def _parse_config(text: str) -> dict:
+    """Return the path options from the [paths] section of INI-style text."""
+    # split() yields [preamble, name, body, name, body, ...]
+    parts = _CFG_SECTION_RE.split(text)
+    config = {}
+    for name, body in zip(parts[1::2], parts[2::2]):
+        if name.strip() == 'paths':
+            config.update((key.lower(), value) for key, value in _CFG_RE.findall(body))
+    return config
+
+# Single-pass line classifiers. Every branch is anchored at the start of the
+# line (keyword checks via lookahead) so alternation order keeps the original
+# priority: the first branch that applies wins, not the leftmost hit.
+_RE_OUT_LINE = re.compile(
+    r'(?P<plusgt>[+>])'
+    r'|(?P<minus>-)'
+    rf'|(?P<ok>(?=.*?(?:{_PAT_SUCCESS})))'
+    rf'|(?P<err>(?=.*?(?:{_PAT_ERROR})))'
+    rf'|(?P<warn>(?=.*?(?:{_PAT_WARN})))'
+    rf'|(?P<ts>{_PAT_TS})'
+    rf'|(?P<brk>{_PAT_BRACKET})'
+)
+_RE_ERR_LINE = re.compile(
+    rf'(?P<err>(?=.*?(?:{_PAT_ERROR})))'
+    rf'|(?P<warn>(?=.*?(?:{_PAT_WARN})))'
+)
 
 def load_config():
     """Load configuration from file."""
-    config = configparser.ConfigParser()
+    config = {}
     
     # Look for config file in multiple locations
     config_locations = [
@@ -30,13 +74,14 @@ def load_config():
     
     config_found = False
     for config_path in config_locations:
-        if config_path.exists():
-            try:
-                config.read(config_path)
-                config_found = True
-                break
-            except Exception as e:
-                print(f"Warning: Failed to read config from {config_path}: {e}", file=sys.stderr)
+        try:
+            config = _parse_config(config_path.read_text())
+            config_found = True
+            break
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"Warning: Failed to read config from {config_path}: {e}", file=sys.stderr)
     
     if not config_found:
         print("Error: No configuration file found. Please create one of the following:", file=sys.stderr)
@@ -47,10 +92,10 @@ def load_config():
     
     # Read configuration values
     try:
-        logs_out_dir = os.path.expanduser(config.get('paths', 'logs_out_dir'))
-        logs_err_dir = os.path.expanduser(config.get('paths', 'logs_err_dir'))
-    except (configparser.NoSectionError, configparser.NoOptionError) as e:
-        print(f"Error: Invalid configuration file - {e}", file=sys.stderr)
+        logs_out_dir = os.path.expanduser(config['logs_out_dir'])
+        logs_err_dir = os.path.expanduser(config['logs_err_dir'])
+    except KeyError as e:
+        print(f"Error: Invalid configuration file - missing option {e}", file=sys.stderr)
         print("Please check your configuration file format.", file=sys.stderr)
         sys.exit(1)
     
@@ -71,47 +116,63 @@ class Colors:
     BOLD = '\033[1m'
     NC = '\033[0m'  # No Color
 
+# Line class (named group of _RE_OUT_LINE/_RE_ERR_LINE) -> color
+_LINE_COLORS = {
+    'plusgt': Colors.GREEN,
+    'minus': Colors.RED,
+    'ok': Colors.GREEN,
+    'err': Colors.RED,
+    'warn': Colors.YELLOW,
+    'ts': Colors.CYAN,
+    'brk': Colors.BLUE,
+}
+
 class SlogViewer:
     def __init__(self, no_color: bool = False):
         self.no_color = no_color or not sys.stdout.isatty()
         self.out_file = ""
         self.err_file = ""
+        
+        # Decide once instead of checking no_color on every call
+        if self.no_color:
+            self.colorize = lambda text, color: text
+            self.colorize_line = lambda line, is_error=False: line
     
     def colorize(self, text: str, color: str) -> str:
-        """Apply color to text if colors are enabled."""
-        if self.no_color:
-            return text
+        """Apply color to text (replaced by a passthrough when colors are disabled)."""
         return f"{color}{text}{Colors.NC}"
     
     def list_recent_logs(self) -> None:
         """List recent log files."""
         print(self.colorize("Recent log files:", Colors.BOLD))
         print(self.colorize("=== Output logs ===", Colors.GREEN))
-        
-        try:
-            out_files = list(Path(LOGS_OUT_DIR).glob("*.out"))
-            out_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            for f in out_files[:10]:
-                stat = f.stat()
-                size = stat.st_size
-                mtime = time.strftime("%b %d %H:%M", time.localtime(stat.st_mtime))
-                print(self.colorize(f"{mtime} {size:>8} {f.name}", Colors.CYAN))
-        except (OSError, FileNotFoundError):
-            pass
+        self._print_recent_logs(LOGS_OUT_DIR, '.out')
         
         print()
         print(self.colorize("=== Error logs ===", Colors.RED))
+        self._print_recent_logs(LOGS_ERR_DIR, '.err')
+    
+    def _print_recent_logs(self, directory: str, suffix: str, count: int = 10) -> None:
+        """Print the most recently modified log files in directory."""
+        def entry_stats(it):
+            # DirEntry caches its stat, so each entry costs at most one syscall
+            for e in it:
+                if e.name.endswith(suffix):
+                    try:
+                        st = e.stat()
+                    except FileNotFoundError:
+                        continue  # Removed since the directory was read
+                    yield st.st_mtime, e.name, st
         
         try:
-            err_files = list(Path(LOGS_ERR_DIR).glob("*.err"))
-            err_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            for f in err_files[:10]:
-                stat = f.stat()
-                size = stat.st_size
-                mtime = time.strftime("%b %d %H:%M", time.localtime(stat.st_mtime))
-                print(self.colorize(f"{mtime} {size:>8} {f.name}", Colors.CYAN))
-        except (OSError, FileNotFoundError):
-            pass
+            with os.scandir(directory) as it:
+                recent = heapq.nlargest(count, entry_stats(it))
+        except OSError:
+            return
+        
+        for _, name, stat in recent:
+            mtime = time.strftime("%b %d %H:%M", time.localtime(stat.st_mtime))
+            print(self.colorize(f"{mtime} {stat.st_size:>8} {name}", Colors.CYAN))
     
     def find_log_files(self, job_input: str) -> bool:
         """Find log files based on job input."""
@@ -123,9 +184,12 @@ class SlogViewer:
             job_id = job_input
             # Try to find job name from existing log files
             try:
-                out_files = list(Path(LOGS_OUT_DIR).glob(f"*-{job_id}.out"))
-                if out_files:
-                    job_name = out_files[0].stem.replace(f"-{job_id}", "")
+                suffix = f"-{job_id}.out"
+                with os.scandir(LOGS_OUT_DIR) as it:
+                    for e in it:
+                        if e.name.endswith(suffix) and len(e.name) > len(suffix):
+                            job_name = e.name[:-len(suffix)]
+                            break
             except (OSError, FileNotFoundError):
                 pass
         else:
@@ -137,16 +201,17 @@ class SlogViewer:
                 job_name = job_input
                 # Find most recent job ID for this job name
                 try:
-                    pattern = f"{job_name}-*.out"
-                    out_files = list(Path(LOGS_OUT_DIR).glob(pattern))
-                    if out_files:
-                        # Sort by version (natural sort for numbers)
-                        out_files.sort(key=lambda x: [int(c) if c.isdigit() else c.lower() 
-                                                    for c in re.split('([0-9]+)', str(x))])
-                        latest = out_files[-1]
-                        job_id = re.search(rf'{re.escape(job_name)}-(\d+)\.out$', str(latest))
-                        if job_id:
-                            job_id = job_id.group(1)
+                    prefix = f"{job_name}-"
+                    best_id = -1
+                    with os.scandir(LOGS_OUT_DIR) as it:
+                        for e in it:
+                            if not (e.name.startswith(prefix) and e.name.endswith('.out')):
+                                continue
+                            # Only {job_name}-{digits}.out, not longer names sharing the prefix
+                            suffix = e.name[len(prefix):-len('.out')]
+                            if suffix.isdecimal() and int(suffix) > best_id:
+                                best_id = int(suffix)
+                                job_id = suffix
                 except (OSError, FileNotFoundError):
                     pass
         
@@ -163,9 +228,6 @@ class SlogViewer:
     
     def colorize_line(self, line: str, is_error: bool = False) -> str:
         """Apply contextual coloring to a line."""
-        if self.no_color:
-            return line
-        
         # Preserve existing ANSI escape sequences
         if '\033[' in line:
             return line
@@ -173,161 +235,249 @@ class SlogViewer:
         # Add contextual coloring for common patterns
         if is_error:
             # Error log coloring
-            if re.search(r'[Ee]rror|ERROR|[Ff]ailed|FAILED', line):
-                return self.colorize(line, Colors.RED)
-            elif re.search(r'[Ww]arning|WARNING', line):
-                return self.colorize(line, Colors.YELLOW)
-            else:
-                return self.colorize(line, Colors.MAGENTA)
-        else:
-            # Output log coloring
-            if re.match(r'^[\+\>]', line):
-                return self.colorize(line, Colors.GREEN)
-            elif re.match(r'^[\-]', line):
-                return self.colorize(line, Colors.RED)
-            elif re.search(r'[Ss]uccess|SUCCESS|[Cc]ompleted|COMPLETED|[Dd]one|DONE', line):
-                return self.colorize(line, Colors.GREEN)
-            elif re.search(r'[Ee]rror|ERROR|[Ff]ailed|FAILED', line):
-                return self.colorize(line, Colors.RED)
-            elif re.search(r'[Ww]arning|WARNING', line):
-                return self.colorize(line, Colors.YELLOW)
-            elif re.match(r'^\d{4}-\d{2}-\d{2}|\d{2}:\d{2}:\d{2}', line):
-                return self.colorize(line, Colors.CYAN)
-            elif re.match(r'^\[.*\]', line):
-                return self.colorize(line, Colors.BLUE)
-            else:
-                return line
+            m = _RE_ERR_LINE.match(line)
+            return self.colorize(line, _LINE_COLORS[m.lastgroup] if m else Colors.MAGENTA)
+        
+        # Output log coloring
+        m = _RE_OUT_LINE.match(line)
+        if m:
+            return self.colorize(line, _LINE_COLORS[m.lastgroup])
+        return line
     
-    def colorize_output(self, file_path: str, is_error: bool = False) -> None:
-        """Display file with appropriate coloring."""
-        if not os.path.exists(file_path):
+    def colorize_output(self, f: BinaryIO, is_error: bool = False) -> None:
+        """Display an open (binary mode) log file with appropriate coloring."""
+        if self.no_color:
+            # Nothing to colorize: copy raw bytes like cat
+            try:
+                sys.stdout.flush()
+                write = sys.stdout.buffer.write
+                last = b''
+                while True:
+                    chunk = f.read(65536)
+                    if not chunk:
+                        break
+                    write(chunk)
+                    last = chunk
+                if last and not last.endswith(b'\n'):
+                    write(b'\n')
+                sys.stdout.buffer.flush()
+            except OSError:
+                print(self.colorize(f"Error reading file: {f.name}", Colors.RED))
             return
         
         # Use less with color support if available and output is to terminal
-        if not self.no_color and sys.stdout.isatty() and os.system("command -v less >/dev/null 2>&1") == 0:
+        less = None
+        if not self.no_color and sys.stdout.isatty():
+            import shutil
+            less = shutil.which('less')
+        
+        if less:
+            import subprocess
             env = os.environ.copy()
             env['LESS'] = '-R'
-            subprocess.run(['less', file_path], env=env)
+            subprocess.run([less, f.name], env=env)
         else:
             # Cat with additional contextual coloring
             try:
-                with open(file_path, 'r', errors='replace') as f:
-                    for line in f:
-                        line = line.rstrip('\n\r')
-                        print(self.colorize_line(line, is_error))
+                # Batch lines into large writes rather than one print() each
+                out = sys.stdout.write
+                buf = []
+                append = buf.append
+                for line in io.TextIOWrapper(f, errors='replace'):
+                    append(self.colorize_line(line.rstrip('\n\r'), is_error))
+                    append('\n')
+                    if len(buf) >= 2048:
+                        out(''.join(buf))
+                        buf.clear()
+                if buf:
+                    out(''.join(buf))
             except (OSError, UnicodeDecodeError):
-                print(self.colorize(f"Error reading file: {file_path}", Colors.RED))
+                print(self.colorize(f"Error reading file: {f.name}", Colors.RED))
     
     def follow_logs(self, out_file: str, err_file: str, show_out: bool, show_err: bool, status_interval: int = 10) -> None:
-        """Follow log files with tail -f equivalent and job status monitoring."""
-        files_to_follow = []
-        if show_out and os.path.exists(out_file):
-            files_to_follow.append(out_file)
-        if show_err and os.path.exists(err_file):
-            files_to_follow.append(err_file)
-        
-        if not files_to_follow:
+        """Follow log files (tail -f style polling) with job status monitoring."""
+        import subprocess
+        
+        # Open whichever requested logs exist; missing ones are not followed
+        followed = []
+        for path, wanted in ((out_file, show_out), (err_file, show_err)):
+            if not wanted:
+                continue
+            try:
+                f = open(path, 'rb')
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                print(self.colorize(f"Warning: Cannot follow {path}: {e.strerror}", Colors.YELLOW))
+                continue
+            is_err = path == err_file
+            followed.append({
+                'path': path,
+                'file': f,
+                'ino': os.fstat(f.fileno()).st_ino,
+                'partial': b'',
+                'is_err': is_err,
+                'header': self.colorize(f"==> {path} <==", Colors.BOLD + (Colors.RED if is_err else Colors.GREEN)),
+            })
+        
+        if not followed:
             print(self.colorize("No log files found to follow", Colors.RED))
             return
         
         # Extract job ID from filename for status monitoring
-        job_id_match = re.search(r'-(\d+)\.(out|err)$', files_to_follow[0])
+        job_id_match = _RE_JOBID.search(followed[0]['path'])
         if not job_id_match:
             print(self.colorize("Warning: Could not extract job ID for status monitoring", Colors.YELLOW))
             job_id = None
         else:
             job_id = job_id_match.group(1)
         
-        if len(files_to_follow) > 1:
+        if len(followed) > 1:
             print(self.colorize("Following both output and error logs in real-time... (Ctrl+C to stop)", Colors.YELLOW))
             print(self.colorize(f"Output lines will be unmarked, error lines will have {self.colorize('[ERR]', Colors.RED)} prefix", Colors.CYAN))
             print()
         else:
-            log_type = "output" if show_out else "error"
+            log_type = "error" if followed[0]['is_err'] else "output"
             print(self.colorize(f"Following {log_type} log... (Ctrl+C to stop)", Colors.YELLOW))
         
+        def split_lines(entry: dict, data: bytes) -> List[bytes]:
+            """Split data into complete lines, keeping the unterminated rest in entry['partial']."""
+            lines = _RE_LINE_BREAK.split(data)
+            entry['partial'] = lines.pop()
+            if data.endswith(b'\r') and lines:
+                # May be the first half of \r\n; wait for the next byte
+                entry['partial'] = lines.pop() + b'\r'
+            return lines
+        
+        def read_tail(entry: dict, n: int = 10) -> List[bytes]:
+            """Return the last n complete lines of a followed file (like tail) and leave it at EOF."""
+            f = entry['file']
+            size = os.fstat(f.fileno()).st_size
+            start = max(0, size - 8192)
+            f.seek(start)
+            # Split the same way as read_new; an unterminated last line stays pending
+            lines = split_lines(entry, f.read())
+            if start > 0 and lines:
+                lines = lines[1:]  # First line is likely cut off
+            return lines[-n:]
+        
+        def read_new(entry: dict) -> List[bytes]:
+            """Return complete lines appended to a followed file since the last read."""
+            f = entry['file']
+            try:
+                st = os.stat(entry['path'])
+            except OSError:
+                return []  # Mid-rotation; try again on the next poll
+            if st.st_ino != entry['ino']:
+                # File was replaced (log rotation): finish the old file, then
+                # read the new one from the start
+                try:
+                    new_file = open(entry['path'], 'rb')
+                except OSError:
+                    return []  # Removed again; try again on the next poll
+                lines = split_lines(entry, entry['partial'] + f.read())
+                if entry['partial']:
+                    lines.append(entry['partial'].rstrip(b'\r'))
+                f.close()
+                entry['file'] = new_file
+                entry['ino'] = os.fstat(new_file.fileno()).st_ino
+                return lines + split_lines(entry, new_file.read())
+            elif st.st_size < f.tell():
+                # File was truncated
+                f.seek(0)
+                entry['partial'] = b''
+            elif st.st_size == f.tell():
+                return []
+            return split_lines(entry, entry['partial'] + f.read())
+        
         try:
-            import threading
-            import queue
-            import sys
-            
-            # Create queue for tail output
-            output_queue = queue.Queue()
-            
-            # Use tail -f
-            cmd = ['tail', '-f'] + files_to_follow
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, 
-                                     universal_newlines=True, bufsize=1)
+            current_status = ""
+            last_path = None
             
-            # Thread to read tail output
-            def read_output():
-                for line in process.stdout:
-                    output_queue.put(('log', line.rstrip('\n\r')))
-                output_queue.put(('done', None))
+            def emit(entry: dict, lines: List[bytes]) -> None:
+                nonlocal last_path
+                # Clear status line before printing log
+                if current_status:
+                    sys.stdout.write('\r' + ' ' * 80 + '\r')
+                
+                # Mark which file the lines come from, like tail does for several files
+                if len(followed) > 1 and entry['path'] != last_path:
+                    if last_path is not None:
+                        print()
+                    print(entry['header'])
+                    last_path = entry['path']
+                
+                is_err = entry['is_err']
+                colorize_line = self.colorize_line
+                for line in lines:
+                    print(colorize_line(line.decode('utf-8', errors='replace'), is_err))
+                
+                # Reprint status line after log output
+                if current_status:
+                    sys.stdout.write(self.colorize(f"[{current_status}]", Colors.CYAN + Colors.BOLD))
+                sys.stdout.flush()
             
-            output_thread = threading.Thread(target=read_output)
-            output_thread.daemon = True
-            output_thread.start()
+            for entry in followed:
+                lines = read_tail(entry)
+                if lines:
+                    emit(entry, lines)
             
-            # Thread to check job status
-            job_running = True
-            last_status = ""
+            next_status_check = time.monotonic()
+            poll_delay = 0.1
             
-            def check_job_status():
-                nonlocal job_running, last_status
-                while job_running:
-                    if job_id:
+            while True:
+                got_output = False
+                for entry in followed:
+                    lines = read_new(entry)
+                    if lines:
+                        emit(entry, lines)
+                        got_output = True
+                
+                if job_id and time.monotonic() >= next_status_check:
+                    next_status_check = time.monotonic() + status_interval
+                    try:
                         result = subprocess.run(['squeue', '-j', job_id, '-h', '-o', '%T %M %R'], 
                                               capture_output=True, text=True)
-                        if result.returncode == 0 and result.stdout.strip():
-                            # Job is still running
-                            status_parts = result.stdout.strip().split(None, 2)
-                            state = status_parts[0] if len(status_parts) > 0 else "UNKNOWN"
-                            runtime = status_parts[1] if len(status_parts) > 1 else "0:00"
-                            reason = status_parts[2] if len(status_parts) > 2 else ""
-                            
-                            status = f"Job {job_id}: {state} - Runtime: {runtime}"
-                            if reason and reason != "None":
-                                status += f" - {reason}"
-                            
-                            if status != last_status:
-                                output_queue.put(('status', status))
-                                last_status = status
-                        else:
-                            # Job completed
-                            job_running = False
-                            output_queue.put(('completed', job_id))
-                    
-                    # Sleep for status_interval seconds unless job completed
-                    for _ in range(status_interval * 10):  # Check every 0.1s for job completion
-                        if not job_running:
-                            break
-                        time.sleep(0.1)
-            
-            if job_id:
-                status_thread = threading.Thread(target=check_job_status)
-                status_thread.daemon = True
-                status_thread.start()
-            
-            # Main loop to display output
-            current_status = ""
-            log_lines = []
-            max_lines = 50  # Keep last 50 lines in memory
-            
-            while True:
-                try:
-                    msg_type, content = output_queue.get(timeout=0.1)
+                    except FileNotFoundError:
+                        # squeue not available; keep following without status updates
+                        job_id = None
+                        continue
                     
-                    if msg_type == 'done':
-                        break
-                    elif msg_type == 'completed':
+                    if result.returncode == 0 and result.stdout.strip():
+                        # Job is still running
+                        status_parts = result.stdout.strip().split(None, 2)
+                        state = status_parts[0] if len(status_parts) > 0 else "UNKNOWN"
+                        runtime = status_parts[1] if len(status_parts) > 1 else "0:00"
+                        reason = status_parts[2] if len(status_parts) > 2 else ""
+                        
+                        status = f"Job {job_id}: {state} - Runtime: {runtime}"
+                        if reason and reason != "None":
+                            status += f" - {reason}"
+                        
+                        if status != current_status:
+                            current_status = status
+                            # Reprint the status line
+                            sys.stdout.write('\r' + ' ' * 80 + '\r')  # Clear line
+                            sys.stdout.write(self.colorize(f"[{current_status}]", Colors.CYAN + Colors.BOLD))
+                            sys.stdout.flush()
+                    else:
+                        # Print what the job wrote while squeue ran, including any
+                        # unterminated last line, before the completion banner
+                        for entry in followed:
+                            lines = read_new(entry)
+                            if entry['partial']:
+                                lines.append(entry['partial'].rstrip(b'\r'))
+                                entry['partial'] = b''
+                            if lines:
+                                emit(entry, lines)
+                        
                         # Job completed, get final status
                         print("\n" + self.colorize("="*80, Colors.BOLD))
-                        print(self.colorize(f"Job {content} completed!", Colors.GREEN + Colors.BOLD))
+                        print(self.colorize(f"Job {job_id} completed!", Colors.GREEN + Colors.BOLD))
                         
                         # Try to get exit status from sacct if available
                         try:
-                            result = subprocess.run(['sacct', '-j', content, '-n', '-X', '-o', 'State,ExitCode'], 
+                            result = subprocess.run(['sacct', '-j', job_id, '-n', '-X', '-o', 'State,ExitCode'], 
                                                   capture_output=True, text=True, timeout=5)
                             if result.returncode == 0 and result.stdout.strip():
                                 state_info = result.stdout.strip().split()
@@ -347,56 +497,23 @@ class SlogViewer:
                             print(self.colorize("Status: Job no longer in queue (sacct not available)", Colors.YELLOW))
                         
                         print(self.colorize("="*80, Colors.BOLD))
-                        process.terminate()
                         return
-                    elif msg_type == 'status':
-                        current_status = content
-                        # Reprint the status line
-                        sys.stdout.write('\r' + ' ' * 80 + '\r')  # Clear line
-                        sys.stdout.write(self.colorize(f"[{current_status}]", Colors.CYAN + Colors.BOLD))
-                        sys.stdout.flush()
-                    elif msg_type == 'log':
-                        # Clear status line before printing log
-                        if current_status:
-                            sys.stdout.write('\r' + ' ' * 80 + '\r')
-                            sys.stdout.flush()
-                        
-                        line = content
-                        # Check if this is a tail header line (==> filename <==)
-                        if re.match(r'^==>', line) and line.endswith('<=='):
-                            if '.err' in line:
-                                print(self.colorize(line, Colors.BOLD + Colors.RED))
-                            else:
-                                print(self.colorize(line, Colors.BOLD + Colors.GREEN))
-                        else:
-                            # Apply live coloring for regular content
-                            if '\033[' in line:
-                                print(line)
-                            elif re.search(r'[Ss]uccess|SUCCESS|[Cc]ompleted|COMPLETED|[Dd]one|DONE', line):
-                                print(self.colorize(line, Colors.GREEN))
-                            elif re.search(r'[Ee]rror|ERROR|[Ff]ailed|FAILED', line):
-                                print(self.colorize(line, Colors.RED))
-                            elif re.search(r'[Ww]arning|WARNING', line):
-                                print(self.colorize(line, Colors.YELLOW))
-                            else:
-                                print(line)
-                        
-                        # Reprint status line after log output
-                        if current_status:
-                            sys.stdout.write(self.colorize(f"[{current_status}]", Colors.CYAN + Colors.BOLD))
-                            sys.stdout.flush()
-                        
-                except queue.Empty:
-                    continue
-                except KeyboardInterrupt:
-                    raise
+                
+                # Poll quickly while output is flowing, back off to 0.5s when idle,
+                # and never sleep past the next status check
+                poll_delay = 0.1 if got_output else min(poll_delay * 2, 0.5)
+                delay = poll_delay
+                if job_id:
+                    delay = min(delay, max(0.0, next_status_check - time.monotonic()))
+                time.sleep(delay)
                         
         except KeyboardInterrupt:
-            if process:
-                process.terminate()
             print("\n" + self.colorize("Stopped following logs", Colors.YELLOW))
         except Exception as e:
             print(self.colorize(f"Error following logs: {e}", Colors.RED))
+        finally:
+            for entry in followed:
+                entry['file'].close()
     
     def show_logs(self, show_out: bool = True, show_err: bool = True, follow: bool = False, status_interval: int = 10) -> None:
         """Display log files."""
@@ -405,33 +522,53 @@ class SlogViewer:
             return
         
         if show_out:
-            if os.path.exists(self.out_file):
-                header = f"=== OUTPUT LOG ({self.out_file}) ==="
-                print(self.colorize(header, Colors.BOLD + Colors.GREEN))
-                self.colorize_output(self.out_file, False)
-            else:
+            try:
+                f = open(self.out_file, 'rb')
+            except FileNotFoundError:
                 print(self.colorize(f"Output log not found: {self.out_file}", Colors.RED))
+            except OSError:
+                print(self.colorize(f"Error reading file: {self.out_file}", Colors.RED))
+            else:
+                with f:
+                    header = f"=== OUTPUT LOG ({self.out_file}) ==="
+                    print(self.colorize(header, Colors.BOLD + Colors.GREEN))
+                    self.colorize_output(f, False)
             print()
         
         if show_err:
-            if os.path.exists(self.err_file):
-                header = f"=== ERROR LOG ({self.err_file}) ==="
-                print(self.colorize(header, Colors.BOLD + Colors.RED))
-                self.colorize_output(self.err_file, True)
-            else:
+            try:
+                f = open(self.err_file, 'rb')
+            except FileNotFoundError:
                 print(self.colorize(f"Error log not found: {self.err_file}", Colors.RED))
+            except OSError:
+                print(self.colorize(f"Error reading file: {self.err_file}", Colors.RED))
+            else:
+                with f:
+                    header = f"=== ERROR LOG ({self.err_file}) ==="
+                    print(self.colorize(header, Colors.BOLD + Colors.RED))
+                    self.colorize_output(f, True)
     
     def show_last_job(self, status_interval: int = 10, **kwargs) -> None:
         """Show logs for the most recent job."""
         try:
-            out_files = list(Path(LOGS_OUT_DIR).glob("*.out"))
-            if not out_files:
+            # Track the most recent file while scanning
+            latest = None
+            latest_mtime = 0.0
+            with os.scandir(LOGS_OUT_DIR) as it:
+                for e in it:
+                    if not e.name.endswith('.out'):
+                        continue
+                    try:
+                        mtime = e.stat().st_mtime
+                    except FileNotFoundError:
+                        continue  # Removed since the directory was read
+                    if latest is None or mtime > latest_mtime:
+                        latest, latest_mtime = e.name, mtime
+            if latest is None:
                 print(self.colorize("No log files found", Colors.RED))
                 return
             
-            # Get most recent file
-            latest = max(out_files, key=lambda x: x.stat().st_mtime)
-            last_job = latest.stem  # Remove .out extension
+            last_job = latest[:-len('.out')]
             
             print(self.colorize(f"Showing logs for most recent job: {last_job}", Colors.BOLD))
             print()
@@ -447,15 +584,21 @@ class SlogViewer:
             print(self.colorize("Usage: slog watch <job_id>", Colors.RED))
             return
         
+        import subprocess
+        
         print(self.colorize(f"Watching job {job_id}...", Colors.BOLD))
         
         try:
+            # Poll often at first, then back off for long-running jobs
+            delay = 2.0
             while True:
-                result = subprocess.run(['squeue', '-j', job_id], 
+                # -h drops the header, so empty output means the job has left the queue
+                result = subprocess.run(['squeue', '-j', job_id, '-h'], 
                                       capture_output=True, text=True)
-                if result.returncode != 0:
+                if result.returncode != 0 or not result.stdout.strip():
                     break
-                time.sleep(10)
+                time.sleep(delay)
+                delay = min(delay * 1.5, 60.0)
                 print(self.colorize(".", Colors.YELLOW), end="", flush=True)
             
             print()
@@ -476,6 +619,8 @@ class SlogViewer:
             print(self.colorize("Usage: slog status <job_id>", Colors.RED))
             return
         
+        import subprocess
+        
         print(self.colorize("=== JOB STATUS ===", Colors.BOLD + Colors.BLUE))
         
         result = subprocess.run(['squeue', '-j', job_id], 
@@ -492,7 +637,10 @@ class SlogViewer:
             self.show_logs(status_interval=status_interval, **kwargs)
 
 
-def main():
+def build_parser():
+    """Build the full argparse parser (used for --help and unusual arguments)."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="SLURM Log Viewer",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -526,12 +674,79 @@ Examples:
                        help='Status update interval in seconds for -f mode (default: 10)')
     parser.add_argument('job_args', nargs='*',
                        help='Additional arguments for watch/status commands')
+    return parser
+
+
+# Flags understood by parse_args_fast, mapped to their argparse dest
+_FAST_FLAGS = {
+    '-f': 'follow', '--follow': 'follow',
+    '-e': 'error', '--error': 'error',
+    '-o': 'out', '--out': 'out',
+    '-l': 'list', '--list': 'list',
+    '--no-color': 'no_color',
+}
+
+def parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common command-line forms without argparse.
     
-    args = parser.parse_args()
+    Returns None for anything unusual (help, unknown or abbreviated options,
+    bad values, split positionals) so the caller can fall back to argparse.
+    """
+    args = SimpleNamespace(job_input=None, follow=False, error=False, out=False,
+                           list=False, no_color=False, status_interval=10, job_args=[])
+    positionals = []
+    positionals_done = False
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if not arg.startswith('-') or arg == '-':
+            # argparse only assigns a single run of positionals
+            if positionals_done or arg == '-':
+                return None
+            positionals.append(arg)
+            continue
+        if positionals:
+            positionals_done = True
+        
+        if arg in _FAST_FLAGS:
+            setattr(args, _FAST_FLAGS[arg], True)
+        elif arg == '--status-interval' or arg.startswith('--status-interval='):
+            if '=' in arg:
+                value = arg.split('=', 1)[1]
+            elif i < len(argv):
+                value = argv[i]
+                i += 1
+            else:
+                return None
+            try:
+                args.status_interval = int(value)
+            except ValueError:
+                return None
+        elif len(arg) > 2 and arg[1] != '-' and all(f"-{c}" in _FAST_FLAGS for c in arg[1:]):
+            # Combined short flags, e.g. -fe
+            for c in arg[1:]:
+                setattr(args, _FAST_FLAGS[f"-{c}"], True)
+        else:
+            return None
     
-    if not args.job_input and not args.list:
-        parser.print_help()
-        sys.exit(1)
+    if positionals:
+        args.job_input = positionals[0]
+        args.job_args = positionals[1:]
+    elif not args.list:
+        return None  # Nothing to do; let argparse print the help
+    return args
+
+
+def main():
+    args = parse_args_fast(sys.argv[1:])
+    if args is None:
+        parser = build_parser()
+        args = parser.parse_args()
+        
+        if not args.job_input and not args.list:
+            parser.print_help()
+            sys.exit(1)
     
     viewer = SlogViewer(no_color=args.no_color)
     
@@ -553,19 +768,20 @@ Examples:
         'status_interval': args.status_interval
     }
     
+    # Special commands that take a job ID argument
+    job_commands = {
+        'watch': viewer.watch_job,
+        'status': viewer.show_job_status,
+    }
+    
     # Handle special commands
     if args.job_input == 'last':
         viewer.show_last_job(**show_options)
-    elif args.job_input == 'watch':
-        if not args.job_args:
-            print(viewer.colorize("Usage: slog.py watch <job_id>", Colors.RED))
-            sys.exit(1)
-        viewer.watch_job(args.job_args[0], **show_options)
-    elif args.job_input == 'status':
+    elif args.job_input in job_commands:
         if not args.job_args:
-            print(viewer.colorize("Usage: slog.py status <job_id>", Colors.RED))
+            print(viewer.colorize(f"Usage: slog.py {args.job_input} <job_id>", Colors.RED))
             sys.exit(1)
-        viewer.show_job_status(args.job_args[0], **show_options)
+        job_commands[args.job_input](args.job_args[0], **show_options)
     else:
         # Regular job input
         if viewer.find_log_files(args.job_input):